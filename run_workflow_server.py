@@ -61,4 +61,11 @@ async def main():
         )
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Prefer uvloop (installed with uvicorn[standard]) for lower per-call
+    # dispatch overhead; fall back to the default loop where unavailable
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
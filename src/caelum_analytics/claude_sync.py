@@ -5,6 +5,7 @@ and system prompts across different machines and environments in a Caelum cluste
 """
 
 import asyncio
+import itertools
 import json
 import os
 import hashlib
@@ -19,6 +20,16 @@ from .cluster_protocol import cluster_node, ClusterMessage, MessageType
 
 logger = logging.getLogger(__name__)
 
+# Per-process sequence for sync request IDs
+_sync_sequence = itertools.count(1)
+
+# Glob patterns used when a configuration path is a directory
+_CONFIG_DIR_PATTERNS = {
+    "hooks": ("**/*.sh", "**/*.py", "**/*.js", "**/*.json"),
+    "system_prompts": ("**/*.md", "**/*.txt", "**/*.json"),
+    "user_profile": ("**/*.json", "**/*.md"),
+}
+
 
 @dataclass
 class ClaudeConfig:
@@ -117,18 +128,8 @@ class ClaudeSyncManager:
                 files.append(path)
             elif path.is_dir():
                 # Recursively find configuration files in directory
-                if config_type == "hooks":
-                    files.extend(path.glob("**/*.sh"))
-                    files.extend(path.glob("**/*.py"))
-                    files.extend(path.glob("**/*.js"))
-                    files.extend(path.glob("**/*.json"))
-                elif config_type == "system_prompts":
-                    files.extend(path.glob("**/*.md"))
-                    files.extend(path.glob("**/*.txt"))
-                    files.extend(path.glob("**/*.json"))
-                elif config_type == "user_profile":
-                    files.extend(path.glob("**/*.json"))
-                    files.extend(path.glob("**/*.md"))
+                for pattern in _CONFIG_DIR_PATTERNS.get(config_type, ()):
+                    files.extend(path.glob(pattern))
                     
         return [f for f in files if f.exists()]
 
@@ -193,7 +194,11 @@ class ClaudeSyncManager:
             logger.warning(f"No configurations found for types: {config_types}")
             return "no_configs_found"
             
-        request_id = f"sync_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}_{machine_registry.local_machine_id}"
+        # Sequence suffix keeps IDs unique when several syncs start in the same second
+        request_id = (
+            f"sync_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
+            f"_{machine_registry.local_machine_id}_{next(_sync_sequence)}"
+        )
         
         # Create sync request
         sync_request = ConfigSyncRequest(
@@ -277,13 +277,13 @@ class ClusterNode:
                     await self._process_message(cluster_msg, websocket)
                 except json.JSONDecodeError as e:
                     logger.error(f"Invalid JSON from {current_machine_id}: {e}")
-                    logger.debug(f"Raw message: {message}")
+                    logger.debug("Raw message: %s", message)
                 except KeyError as e:
                     logger.error(f"Missing required field in message from {current_machine_id}: {e}")
-                    logger.debug(f"Raw message: {message}")
+                    logger.debug("Raw message: %s", message)
                 except Exception as e:
                     logger.error(f"Error processing message from {current_machine_id}: {e}")
-                    logger.debug(f"Raw message: {message}")
+                    logger.debug("Raw message: %s", message)
         except websockets.exceptions.ConnectionClosed:
             logger.info(f"Connection to {current_machine_id} closed")
             if current_machine_id in self.connections:
@@ -1008,8 +1008,9 @@ class DistributedCodeAnalyzer:
         for node in ast.walk(tree):
             if isinstance(node, ast.FunctionDef):
                 # Check function length
-                if hasattr(node, "end_lineno") and node.end_lineno:
-                    func_length = node.end_lineno - node.lineno
+                end_lineno = getattr(node, "end_lineno", None)
+                if end_lineno:
+                    func_length = end_lineno - node.lineno
                     if func_length > 50:
                         warnings.append(
                             f"Long function '{node.name}' ({func_length} lines)"
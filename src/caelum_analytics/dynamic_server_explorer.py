@@ -6,6 +6,7 @@ purposes, and workflow relationships. Essential for managing complex server ecos
 """
 
 from typing import Dict, List, Any, Optional, Set
+from collections import defaultdict
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import json
@@ -51,6 +52,159 @@ class WorkflowInfo:
     use_cases: List[str]
     dependencies: List[str]
 
+# Static ecosystem catalog, built once at import instead of on every initialize()
+
+# Workflow servers (new architecture)
+_WORKFLOW_SERVERS = {
+    "caelum-development-workflow": {
+        "description": "Complete development lifecycle management",
+        "underlying_services": ["caelum-code-analysis", "caelum-project-intelligence", "caelum-development-session"],
+        "tools": [
+            {"name": "analyze_code_quality", "category": "analysis", "priority": 5},
+            {"name": "search_code_patterns", "category": "analysis", "priority": 4},
+            {"name": "analyze_project_structure", "category": "analysis", "priority": 4},
+            {"name": "track_development_session", "category": "management", "priority": 3},
+            {"name": "optimize_development_workflow", "category": "optimization", "priority": 4},
+        ],
+        "capabilities": ["Code Analysis", "Project Intelligence", "Session Tracking", "Workflow Optimization"],
+        "workflows": ["development-lifecycle", "code-review", "project-analysis"]
+    },
+
+    "caelum-business-workflow": {
+        "description": "Business intelligence and market research",
+        "underlying_services": ["caelum-business-intelligence", "caelum-opportunity-discovery", "caelum-user-profile"],
+        "tools": [
+            {"name": "research_market_intelligence", "category": "research", "priority": 5},
+            {"name": "discover_business_opportunities", "category": "discovery", "priority": 5},
+            {"name": "analyze_competitive_landscape", "category": "analysis", "priority": 4},
+            {"name": "generate_business_insights", "category": "analysis", "priority": 4},
+            {"name": "get_personalized_insights", "category": "personalization", "priority": 4},
+        ],
+        "capabilities": ["Market Research", "Opportunity Discovery", "Competitive Analysis", "Business Intelligence"],
+        "workflows": ["market-research", "opportunity-analysis", "competitive-intelligence"]
+    },
+
+    "caelum-infrastructure-workflow": {
+        "description": "Infrastructure and deployment management",
+        "underlying_services": ["caelum-device-orchestration", "caelum-cluster-communication", "caelum-workflow-orchestration"],
+        "tools": [
+            {"name": "orchestrate_multi_device", "category": "orchestration", "priority": 5},
+            {"name": "manage_cluster_communication", "category": "communication", "priority": 5},
+            {"name": "execute_distributed_workflow", "category": "execution", "priority": 5},
+            {"name": "deploy_infrastructure", "category": "deployment", "priority": 4},
+            {"name": "monitor_system_health", "category": "monitoring", "priority": 4},
+        ],
+        "capabilities": ["Device Orchestration", "Cluster Communication", "Workflow Execution", "Infrastructure Deployment"],
+        "workflows": ["deployment-pipeline", "infrastructure-management", "distributed-processing"]
+    },
+
+    "caelum-communication-workflow": {
+        "description": "Communication and knowledge management",
+        "underlying_services": ["caelum-notifications", "caelum-intelligence-hub", "caelum-knowledge-management"],
+        "tools": [
+            {"name": "send_smart_notification", "category": "messaging", "priority": 5},
+            {"name": "aggregate_intelligence", "category": "intelligence", "priority": 4},
+            {"name": "manage_knowledge_base", "category": "knowledge", "priority": 4},
+            {"name": "search_knowledge_graph", "category": "search", "priority": 4},
+            {"name": "sync_cross_device", "category": "synchronization", "priority": 3},
+        ],
+        "capabilities": ["Smart Notifications", "Intelligence Aggregation", "Knowledge Management", "Cross-device Sync"],
+        "workflows": ["notification-delivery", "knowledge-curation", "intelligence-synthesis"]
+    },
+
+    "caelum-security-workflow": {
+        "description": "Security, compliance, and optimization", 
+        "underlying_services": ["caelum-security-compliance", "caelum-security-management"],
+        "tools": [
+            {"name": "scan_security_vulnerabilities", "category": "scanning", "priority": 5},
+            {"name": "manage_api_keys", "category": "key_management", "priority": 5},
+            {"name": "check_compliance_status", "category": "compliance", "priority": 4},
+            {"name": "encrypt_sensitive_data", "category": "encryption", "priority": 4},
+            {"name": "review_access_controls", "category": "access_control", "priority": 4},
+        ],
+        "capabilities": ["Vulnerability Scanning", "Compliance Checking", "API Key Management", "Access Control"],
+        "workflows": ["security-audit", "compliance-assessment", "access-review"]
+    }
+}
+
+# Individual servers (legacy/specialized)
+_INDIVIDUAL_SERVERS = {
+    "caelum-ollama-pool": {
+        "description": "Tier1 LLM integration with cost optimization",
+        "type": "individual",
+        "underlying_services": ["ollama-pool"],
+        "tools": [
+            {"name": "route_llm_request", "category": "routing", "priority": 5},
+            {"name": "get_pool_health_status", "category": "monitoring", "priority": 4},
+            {"name": "optimize_model_distribution", "category": "optimization", "priority": 4},
+        ],
+        "capabilities": ["LLM Routing", "Cost Optimization", "Pool Management"],
+        "workflows": ["cost-optimization", "llm-routing"]
+    },
+
+    "filesystem": {
+        "description": "Core filesystem operations",
+        "type": "core",
+        "underlying_services": ["filesystem"],
+        "tools": [
+            {"name": "read_text_file", "category": "io", "priority": 5},
+            {"name": "write_file", "category": "io", "priority": 5},
+            {"name": "list_directory", "category": "io", "priority": 4},
+            {"name": "search_files", "category": "search", "priority": 4},
+        ],
+        "capabilities": ["File Operations", "Directory Management", "File Search"],
+        "workflows": ["file-management", "data-access"]
+    }
+}
+
+# Workflow definitions
+_WORKFLOW_DEFINITIONS = {
+    "development-lifecycle": {
+        "description": "Complete software development lifecycle management",
+        "servers": ["caelum-development-workflow"],
+        "complexity": "complex",
+        "use_cases": ["Code development", "Quality assurance", "Project management"],
+        "dependencies": []
+    },
+    "market-research": {
+        "description": "Comprehensive market research and competitive analysis",
+        "servers": ["caelum-business-workflow"],
+        "complexity": "moderate",
+        "use_cases": ["Market analysis", "Competitor research", "Opportunity identification"],
+        "dependencies": []
+    },
+    "infrastructure-management": {
+        "description": "Infrastructure deployment and orchestration",
+        "servers": ["caelum-infrastructure-workflow"],
+        "complexity": "complex",
+        "use_cases": ["Infrastructure deployment", "Multi-device coordination", "System monitoring"],
+        "dependencies": []
+    },
+    "cost-optimization": {
+        "description": "LLM cost optimization and intelligent routing",
+        "servers": ["caelum-ollama-pool", "caelum-development-workflow"],
+        "complexity": "moderate",
+        "use_cases": ["Cost reduction", "Performance optimization", "Resource allocation"],
+        "dependencies": []
+    },
+    "security-audit": {
+        "description": "Comprehensive security assessment and compliance",
+        "servers": ["caelum-security-workflow"],
+        "complexity": "complex",
+        "use_cases": ["Vulnerability assessment", "Compliance checking", "Access control"],
+        "dependencies": []
+    }
+}
+
+# Server type -> hierarchy section; anything else is an individual server
+_HIERARCHY_SECTIONS = {
+    "workflow": "workflow_servers",
+    "core": "core_servers",
+}
+
+# Upper bound on memoized capability searches
+_SEARCH_CACHE_SIZE = 256
+
 class DynamicServerExplorer:
     """
     Dynamic exploration and presentation of MCP server ecosystem
@@ -61,131 +215,39 @@ class DynamicServerExplorer:
         self.tools: Dict[str, ToolInfo] = {}
         self.workflows: Dict[str, WorkflowInfo] = {}
         self.tool_relationships: Dict[str, List[str]] = {}
+        # Hierarchy views keyed by expand_tools; only change on initialize()
+        self._hierarchy_cache: Dict[bool, Dict[str, Any]] = {}
+        # Lowercased search fields and memoized searches; rebuilt on initialize()
+        self._search_index: Dict[str, List[tuple]] = {"servers": [], "tools": [], "workflows": []}
+        self._search_cache: Dict[str, Dict[str, Any]] = {}
         
     async def initialize(self):
         """Initialize the server explorer with current ecosystem data"""
+        self._hierarchy_cache.clear()
         await self._discover_servers()
         await self._analyze_tool_relationships()
         await self._map_workflows()
+        self._build_search_index()
         logger.info(f"Initialized explorer: {len(self.servers)} servers, {len(self.tools)} tools, {len(self.workflows)} workflows")
     
     async def _discover_servers(self):
         """Discover and catalog all MCP servers"""
-        # Workflow servers (new architecture)
-        workflow_servers = {
-            "caelum-development-workflow": {
-                "description": "Complete development lifecycle management",
-                "underlying_services": ["caelum-code-analysis", "caelum-project-intelligence", "caelum-development-session"],
-                "tools": [
-                    {"name": "analyze_code_quality", "category": "analysis", "priority": 5},
-                    {"name": "search_code_patterns", "category": "analysis", "priority": 4},
-                    {"name": "analyze_project_structure", "category": "analysis", "priority": 4},
-                    {"name": "track_development_session", "category": "management", "priority": 3},
-                    {"name": "optimize_development_workflow", "category": "optimization", "priority": 4},
-                ],
-                "capabilities": ["Code Analysis", "Project Intelligence", "Session Tracking", "Workflow Optimization"],
-                "workflows": ["development-lifecycle", "code-review", "project-analysis"]
-            },
-            
-            "caelum-business-workflow": {
-                "description": "Business intelligence and market research",
-                "underlying_services": ["caelum-business-intelligence", "caelum-opportunity-discovery", "caelum-user-profile"],
-                "tools": [
-                    {"name": "research_market_intelligence", "category": "research", "priority": 5},
-                    {"name": "discover_business_opportunities", "category": "discovery", "priority": 5},
-                    {"name": "analyze_competitive_landscape", "category": "analysis", "priority": 4},
-                    {"name": "generate_business_insights", "category": "analysis", "priority": 4},
-                    {"name": "get_personalized_insights", "category": "personalization", "priority": 4},
-                ],
-                "capabilities": ["Market Research", "Opportunity Discovery", "Competitive Analysis", "Business Intelligence"],
-                "workflows": ["market-research", "opportunity-analysis", "competitive-intelligence"]
-            },
-            
-            "caelum-infrastructure-workflow": {
-                "description": "Infrastructure and deployment management",
-                "underlying_services": ["caelum-device-orchestration", "caelum-cluster-communication", "caelum-workflow-orchestration"],
-                "tools": [
-                    {"name": "orchestrate_multi_device", "category": "orchestration", "priority": 5},
-                    {"name": "manage_cluster_communication", "category": "communication", "priority": 5},
-                    {"name": "execute_distributed_workflow", "category": "execution", "priority": 5},
-                    {"name": "deploy_infrastructure", "category": "deployment", "priority": 4},
-                    {"name": "monitor_system_health", "category": "monitoring", "priority": 4},
-                ],
-                "capabilities": ["Device Orchestration", "Cluster Communication", "Workflow Execution", "Infrastructure Deployment"],
-                "workflows": ["deployment-pipeline", "infrastructure-management", "distributed-processing"]
-            },
-            
-            "caelum-communication-workflow": {
-                "description": "Communication and knowledge management",
-                "underlying_services": ["caelum-notifications", "caelum-intelligence-hub", "caelum-knowledge-management"],
-                "tools": [
-                    {"name": "send_smart_notification", "category": "messaging", "priority": 5},
-                    {"name": "aggregate_intelligence", "category": "intelligence", "priority": 4},
-                    {"name": "manage_knowledge_base", "category": "knowledge", "priority": 4},
-                    {"name": "search_knowledge_graph", "category": "search", "priority": 4},
-                    {"name": "sync_cross_device", "category": "synchronization", "priority": 3},
-                ],
-                "capabilities": ["Smart Notifications", "Intelligence Aggregation", "Knowledge Management", "Cross-device Sync"],
-                "workflows": ["notification-delivery", "knowledge-curation", "intelligence-synthesis"]
-            },
-            
-            "caelum-security-workflow": {
-                "description": "Security, compliance, and optimization", 
-                "underlying_services": ["caelum-security-compliance", "caelum-security-management"],
-                "tools": [
-                    {"name": "scan_security_vulnerabilities", "category": "scanning", "priority": 5},
-                    {"name": "manage_api_keys", "category": "key_management", "priority": 5},
-                    {"name": "check_compliance_status", "category": "compliance", "priority": 4},
-                    {"name": "encrypt_sensitive_data", "category": "encryption", "priority": 4},
-                    {"name": "review_access_controls", "category": "access_control", "priority": 4},
-                ],
-                "capabilities": ["Vulnerability Scanning", "Compliance Checking", "API Key Management", "Access Control"],
-                "workflows": ["security-audit", "compliance-assessment", "access-review"]
-            }
-        }
+        # Every server catalogued in this pass shares one timestamp
+        discovered_at = datetime.utcnow()
         
-        # Individual servers (legacy/specialized)
-        individual_servers = {
-            "caelum-ollama-pool": {
-                "description": "Tier1 LLM integration with cost optimization",
-                "type": "individual",
-                "underlying_services": ["ollama-pool"],
-                "tools": [
-                    {"name": "route_llm_request", "category": "routing", "priority": 5},
-                    {"name": "get_pool_health_status", "category": "monitoring", "priority": 4},
-                    {"name": "optimize_model_distribution", "category": "optimization", "priority": 4},
-                ],
-                "capabilities": ["LLM Routing", "Cost Optimization", "Pool Management"],
-                "workflows": ["cost-optimization", "llm-routing"]
-            },
-            
-            "filesystem": {
-                "description": "Core filesystem operations",
-                "type": "core",
-                "underlying_services": ["filesystem"],
-                "tools": [
-                    {"name": "read_text_file", "category": "io", "priority": 5},
-                    {"name": "write_file", "category": "io", "priority": 5},
-                    {"name": "list_directory", "category": "io", "priority": 4},
-                    {"name": "search_files", "category": "search", "priority": 4},
-                ],
-                "capabilities": ["File Operations", "Directory Management", "File Search"],
-                "workflows": ["file-management", "data-access"]
-            }
-        }
-        
-        # Build server registry
-        for server_name, server_data in workflow_servers.items():
+        # Build server registry; catalog lists are copied so callers mutating
+        # a server's lists cannot reach the module-level catalog
+        for server_name, server_data in _WORKFLOW_SERVERS.items():
             self.servers[server_name] = ServerInfo(
                 name=server_name,
                 type="workflow",
                 description=server_data["description"],
                 status="active",
                 tool_count=len(server_data["tools"]),
-                underlying_services=server_data["underlying_services"],
-                workflows=server_data["workflows"],
-                capabilities=server_data["capabilities"],
-                last_updated=datetime.utcnow()
+                underlying_services=list(server_data["underlying_services"]),
+                workflows=list(server_data["workflows"]),
+                capabilities=list(server_data["capabilities"]),
+                last_updated=discovered_at
             )
             
             # Register tools
@@ -197,82 +259,51 @@ class DynamicServerExplorer:
                     category=tool_data["category"],
                     priority=tool_data["priority"],
                     underlying_service=server_name,
-                    workflow_context=server_data["workflows"],
+                    workflow_context=list(server_data["workflows"]),
                     use_cases=[],
                     parameters={},
                     related_tools=[]
                 )
         
-        for server_name, server_data in individual_servers.items():
+        for server_name, server_data in _INDIVIDUAL_SERVERS.items():
             self.servers[server_name] = ServerInfo(
                 name=server_name,
                 type=server_data["type"],
                 description=server_data["description"], 
                 status="active",
                 tool_count=len(server_data["tools"]),
-                underlying_services=server_data["underlying_services"],
-                workflows=server_data["workflows"],
-                capabilities=server_data["capabilities"],
-                last_updated=datetime.utcnow()
+                underlying_services=list(server_data["underlying_services"]),
+                workflows=list(server_data["workflows"]),
+                capabilities=list(server_data["capabilities"]),
+                last_updated=discovered_at
             )
     
     async def _analyze_tool_relationships(self):
         """Analyze relationships between tools"""
-        # Simple relationship mapping based on categories and workflows
+        # Simple relationship mapping based on categories and workflows.
+        # Index tools by category and workflow once so each tool only looks
+        # at its actual neighbours instead of scanning every other tool.
+        position = {tool_name: i for i, tool_name in enumerate(self.tools)}
+        by_category: Dict[str, Set[str]] = defaultdict(set)
+        by_workflow: Dict[str, Set[str]] = defaultdict(set)
+        for tool_name, tool_info in self.tools.items():
+            by_category[tool_info.category].add(tool_name)
+            for workflow in tool_info.workflow_context:
+                by_workflow[workflow].add(tool_name)
+
         for tool_name, tool_info in self.tools.items():
-            related = []
-            for other_name, other_info in self.tools.items():
-                if other_name != tool_name:
-                    # Same category
-                    if tool_info.category == other_info.category:
-                        related.append(other_name)
-                    # Same workflow context
-                    elif set(tool_info.workflow_context) & set(other_info.workflow_context):
-                        related.append(other_name)
-                        
-            self.tool_relationships[tool_name] = related[:5]  # Limit to top 5
+            # Same category or same workflow context
+            related = set(by_category[tool_info.category])
+            for workflow in tool_info.workflow_context:
+                related |= by_workflow[workflow]
+            related.discard(tool_name)
+
+            # Keep catalog order, limit to top 5
+            self.tool_relationships[tool_name] = sorted(related, key=position.__getitem__)[:5]
     
     async def _map_workflows(self):
         """Map and analyze workflows"""
-        workflow_definitions = {
-            "development-lifecycle": {
-                "description": "Complete software development lifecycle management",
-                "servers": ["caelum-development-workflow"],
-                "complexity": "complex",
-                "use_cases": ["Code development", "Quality assurance", "Project management"],
-                "dependencies": []
-            },
-            "market-research": {
-                "description": "Comprehensive market research and competitive analysis",
-                "servers": ["caelum-business-workflow"],
-                "complexity": "moderate",
-                "use_cases": ["Market analysis", "Competitor research", "Opportunity identification"],
-                "dependencies": []
-            },
-            "infrastructure-management": {
-                "description": "Infrastructure deployment and orchestration",
-                "servers": ["caelum-infrastructure-workflow"],
-                "complexity": "complex",
-                "use_cases": ["Infrastructure deployment", "Multi-device coordination", "System monitoring"],
-                "dependencies": []
-            },
-            "cost-optimization": {
-                "description": "LLM cost optimization and intelligent routing",
-                "servers": ["caelum-ollama-pool", "caelum-development-workflow"],
-                "complexity": "moderate",
-                "use_cases": ["Cost reduction", "Performance optimization", "Resource allocation"],
-                "dependencies": []
-            },
-            "security-audit": {
-                "description": "Comprehensive security assessment and compliance",
-                "servers": ["caelum-security-workflow"],
-                "complexity": "complex",
-                "use_cases": ["Vulnerability assessment", "Compliance checking", "Access control"],
-                "dependencies": []
-            }
-        }
-        
-        for workflow_name, workflow_data in workflow_definitions.items():
+        for workflow_name, workflow_data in _WORKFLOW_DEFINITIONS.items():
             tools_count = sum(
                 server.tool_count for server_name, server in self.servers.items()
                 if server_name in workflow_data["servers"]
@@ -281,15 +312,23 @@ class DynamicServerExplorer:
             self.workflows[workflow_name] = WorkflowInfo(
                 name=workflow_name,
                 description=workflow_data["description"],
-                servers_involved=workflow_data["servers"],
+                servers_involved=list(workflow_data["servers"]),
                 tools_count=tools_count,
                 complexity=workflow_data["complexity"],
-                use_cases=workflow_data["use_cases"],
-                dependencies=workflow_data["dependencies"]
+                use_cases=list(workflow_data["use_cases"]),
+                dependencies=list(workflow_data["dependencies"])
             )
     
     def get_server_hierarchy(self, expand_tools: bool = False) -> Dict[str, Any]:
-        """Get hierarchical view of all servers"""
+        """Get hierarchical view of all servers
+        
+        The view is cached until the next initialize(); callers share the
+        returned dict and must not mutate it.
+        """
+        cached = self._hierarchy_cache.get(expand_tools)
+        if cached is not None:
+            return cached
+            
         hierarchy = {
             "workflow_servers": {},
             "individual_servers": {},
@@ -319,13 +358,10 @@ class DynamicServerExplorer:
                 ]
                 server_data["tools"] = [asdict(tool) for tool in server_tools]
             
-            if server_info.type == "workflow":
-                hierarchy["workflow_servers"][server_name] = server_data
-            elif server_info.type == "core":
-                hierarchy["core_servers"][server_name] = server_data
-            else:
-                hierarchy["individual_servers"][server_name] = server_data
+            section = _HIERARCHY_SECTIONS.get(server_info.type, "individual_servers")
+            hierarchy[section][server_name] = server_data
         
+        self._hierarchy_cache[expand_tools] = hierarchy
         return hierarchy
     
     def get_tool_details(self, tool_name: str, include_related: bool = True) -> Dict[str, Any]:
@@ -376,32 +412,54 @@ class DynamicServerExplorer:
         
         return result
     
+    def _build_search_index(self):
+        """Lowercase every searchable field once, so searches only do substring checks"""
+        self._search_cache.clear()
+        self._search_index = {
+            "servers": [
+                (server_name, server_info, [(cap, cap.lower()) for cap in server_info.capabilities])
+                for server_name, server_info in self.servers.items()
+            ],
+            "tools": [
+                (tool_info, tool_info.description.lower(), tool_info.category.lower())
+                for tool_info in self.tools.values()
+            ],
+            "workflows": [
+                (workflow_name, workflow_info, [(use_case, use_case.lower()) for use_case in workflow_info.use_cases])
+                for workflow_name, workflow_info in self.workflows.items()
+            ],
+        }
+    
     def search_by_capability(self, capability: str) -> Dict[str, Any]:
-        """Search servers and tools by capability"""
+        """Search servers and tools by capability
+        
+        Results are memoized per capability until the next initialize();
+        callers share the returned dict and must not mutate it.
+        """
+        capability_lower = capability.lower()
+        cached = self._search_cache.get(capability_lower)
+        if cached is not None:
+            return cached
+            
         results = {
             "servers": [],
             "tools": [],
             "workflows": []
         }
         
-        capability_lower = capability.lower()
-        
         # Search servers
-        for server_name, server_info in self.servers.items():
-            if any(capability_lower in cap.lower() for cap in server_info.capabilities):
+        for server_name, server_info, capabilities in self._search_index["servers"]:
+            matching = [cap for cap, cap_lower in capabilities if capability_lower in cap_lower]
+            if matching:
                 results["servers"].append({
                     "name": server_name,
                     "description": server_info.description,
-                    "matching_capabilities": [
-                        cap for cap in server_info.capabilities 
-                        if capability_lower in cap.lower()
-                    ]
+                    "matching_capabilities": matching
                 })
         
         # Search tools
-        for tool_name, tool_info in self.tools.items():
-            if (capability_lower in tool_info.description.lower() or
-                capability_lower in tool_info.category.lower()):
+        for tool_info, description_lower, category_lower in self._search_index["tools"]:
+            if capability_lower in description_lower or capability_lower in category_lower:
                 results["tools"].append({
                     "name": tool_info.name,
                     "description": tool_info.description,
@@ -410,17 +468,19 @@ class DynamicServerExplorer:
                 })
         
         # Search workflows
-        for workflow_name, workflow_info in self.workflows.items():
-            if any(capability_lower in use_case.lower() for use_case in workflow_info.use_cases):
+        for workflow_name, workflow_info, use_cases in self._search_index["workflows"]:
+            matching = [use_case for use_case, use_case_lower in use_cases if capability_lower in use_case_lower]
+            if matching:
                 results["workflows"].append({
                     "name": workflow_name,
                     "description": workflow_info.description,
-                    "matching_use_cases": [
-                        use_case for use_case in workflow_info.use_cases
-                        if capability_lower in use_case.lower()
-                    ]
+                    "matching_use_cases": matching
                 })
         
+        if len(self._search_cache) >= _SEARCH_CACHE_SIZE:
+            # Evict the oldest entry
+            del self._search_cache[next(iter(self._search_cache))]
+        self._search_cache[capability_lower] = results
         return results
     
     def generate_ecosystem_map(self) -> Dict[str, Any]:
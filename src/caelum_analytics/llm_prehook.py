@@ -109,6 +109,7 @@ class LLMPreHook:
                 filtered_count, 
                 llm_config["cost_per_request"]
             )
+            processing_time = (datetime.utcnow() - start_time).total_seconds()
             
             # Log the optimization
             await self._log_optimization(
@@ -117,7 +118,7 @@ class LLMPreHook:
                 original_tools=original_count,
                 filtered_tools=filtered_count,
                 cost_savings=cost_savings,
-                processing_time=(datetime.utcnow() - start_time).total_seconds()
+                processing_time=processing_time
             )
             
             return {
@@ -130,7 +131,7 @@ class LLMPreHook:
                     "reduction_percentage": round((1 - filtered_count / original_count) * 100, 1),
                     "cost_savings_estimate": cost_savings,
                     "llm_provider": llm_provider,
-                    "processing_time_seconds": (datetime.utcnow() - start_time).total_seconds()
+                    "processing_time_seconds": processing_time
                 }
             }
             
@@ -178,10 +179,14 @@ class LLMPreHook:
         }
         
         # Log to evolutionary monitor for tracking
-        if hasattr(self.monitor, 'log_cost_optimization'):
-            await self.monitor.log_cost_optimization(optimization_data)
+        log_cost_optimization = getattr(self.monitor, 'log_cost_optimization', None)
+        if log_cost_optimization is not None:
+            await log_cost_optimization(optimization_data)
             
-        logger.info(f"LLM Pre-hook: {llm_provider} - Reduced {original_tools} → {filtered_tools} tools ({optimization_data['reduction_percentage']}% reduction)")
+        logger.info(
+            "LLM Pre-hook: %s - Reduced %s → %s tools (%s%% reduction)",
+            llm_provider, original_tools, filtered_tools, optimization_data["reduction_percentage"]
+        )
         
     async def get_optimization_report(self, hours: int = 24) -> Dict[str, Any]:
         """Generate optimization report for the specified time period"""
@@ -39,11 +39,8 @@ class PortEnforcer:
                 )
 
         # Check if port is actually in use
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
         try:
-            result = sock.connect_ex(("0.0.0.0", port))
-            sock.close()
+            result = cls._probe(port)
 
             if result == 0:
                 # Port is in use, try to identify what's using it
@@ -68,6 +65,13 @@ class PortEnforcer:
         except Exception as e:
             return True, f"Port {port} appears available (check failed: {e})"
 
+    @staticmethod
+    def _probe(port: int) -> int:
+        """Try a local TCP connect; 0 means something is listening."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1)
+            return sock.connect_ex(("0.0.0.0", port))
+
     @classmethod
     def enforce_port(
         cls, port: int, service_name: str, exit_on_conflict: bool = True
@@ -112,12 +116,8 @@ class PortEnforcer:
             if port in cls.RESERVED_PORTS:
                 continue
 
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
             try:
-                result = sock.connect_ex(("0.0.0.0", port))
-                sock.close()
-                if result != 0:
+                if cls._probe(port) != 0:
                     return port
             except:
                 return port
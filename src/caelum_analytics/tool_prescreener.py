@@ -5,16 +5,127 @@ Reduces 100+ tools to relevant subset based on query analysis.
 Critical for GitHub Copilot and other tool-limited LLMs.
 """
 
-from typing import Dict, List, Set, Optional, Any
+from typing import Dict, List, Set, FrozenSet, Optional, Any
 import re
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 import asyncio
+import heapq
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Query patterns, compiled once at import
+_WORD_PATTERN = re.compile(r'\b\w+\b')
+_FILE_EXTENSION_PATTERN = re.compile(r'\.\w+\b')
+
+# Whole-word vocabularies matched against the query's word list
+_TECH_WORDS = frozenset({"python", "javascript", "typescript", "node", "react", "api", "database"})
+_MULTI_INTENT_WORDS = (
+    frozenset({"and", "also", "additionally", "furthermore"}),
+    frozenset({"then", "after", "next", "subsequently"}),
+)
+_TECHNICAL_WORDS = frozenset({"integrate", "implement", "architecture", "system", "complex"})
+
+# Intent keywords, checked in order - the first intent with a matching query
+# word wins. Whole-word sets are equivalent to the former \b(...)\b patterns
+_INTENT_KEYWORDS = {
+    "code_analysis": frozenset({"analyze", "review", "code", "quality", "security", "performance", "bug", "error"}),
+    "business_research": frozenset({"market", "business", "research", "competitor", "intelligence", "opportunity"}),
+    "development": frozenset({"develop", "create", "build", "implement", "session", "time", "track"}),
+    "deployment": frozenset({"deploy", "infrastructure", "server", "orchestration", "device"}),
+    "security": frozenset({"security", "compliance", "audit", "encrypt", "vulnerability"}),
+    "communication": frozenset({"notify", "alert", "message", "communication", "send"}),
+    "optimization": frozenset({"optimize", "performance", "cost", "efficiency", "local"}),
+}
+
+# Intent -> tool keyword that earns the intent-specific scoring boost
+_INTENT_BOOST_KEYWORDS = {
+    "code_analysis": "code",
+    "business_research": "business",
+    "security": "security",
+}
+
+# Tool metadata for key Caelum servers
+_CAELUM_TOOL_CATALOG = {
+    "caelum-code-analysis": {
+        "category": "analysis",
+        "keywords": ["code", "security", "quality", "performance", "analyze", "review"],
+        "tools": ["analyze_code", "get_code_statistics", "search_similar_code"],
+        "priority": 5
+    },
+    "caelum-business-intelligence": {
+        "category": "business", 
+        "keywords": ["market", "research", "business", "intelligence", "competitor", "analysis"],
+        "tools": ["research_market"],
+        "priority": 4
+    },
+    "caelum-ollama-pool": {
+        "category": "core",
+        "keywords": ["llm", "route", "optimization", "cost", "local", "processing"],
+        "tools": ["route_llm_request", "get_pool_health_status", "optimize_model_distribution"],
+        "priority": 5
+    },
+    "caelum-project-intelligence": {
+        "category": "development",
+        "keywords": ["project", "analyze", "dependencies", "intelligence"],
+        "tools": ["analyze_project", "list_projects", "get_project_details"],
+        "priority": 4
+    },
+    "caelum-device-orchestration": {
+        "category": "infrastructure",
+        "keywords": ["device", "orchestration", "deployment", "infrastructure"],
+        "tools": ["list_devices", "register_device", "execute_command", "deploy_mcp_server"],
+        "priority": 3
+    },
+    "caelum-notifications": {
+        "category": "communication",
+        "keywords": ["notification", "alert", "message", "communication"],
+        "tools": ["send_notification", "list_notifications", "get_notification_status"],
+        "priority": 3
+    },
+    "filesystem": {
+        "category": "core",
+        "keywords": ["file", "directory", "read", "write", "filesystem"],
+        "tools": ["read_text_file", "write_file", "list_directory", "search_files"],
+        "priority": 5
+    }
+}
+
+# External tools (Claude Code built-ins, etc.)
+_EXTERNAL_TOOL_CATALOG = {
+    "Read": {"category": "core", "keywords": ["read", "file", "content"], "priority": 5},
+    "Write": {"category": "core", "keywords": ["write", "file", "create"], "priority": 5},
+    "Edit": {"category": "core", "keywords": ["edit", "modify", "change"], "priority": 5},
+    "Bash": {"category": "core", "keywords": ["command", "execute", "shell"], "priority": 5},
+    "Grep": {"category": "analysis", "keywords": ["search", "find", "pattern"], "priority": 4},
+    "Glob": {"category": "analysis", "keywords": ["file", "pattern", "match"], "priority": 4},
+    "TodoWrite": {"category": "development", "keywords": ["todo", "task", "track"], "priority": 3}
+}
+
+# Tools-needed estimate: base count per intent, scaled by complexity
+_BASE_TOOL_ESTIMATES = {
+    "code_analysis": 15,
+    "business_research": 10,
+    "development": 20,
+    "deployment": 12,
+    "security": 8,
+    "communication": 6,
+    "optimization": 10,
+    "general": 25
+}
+_COMPLEXITY_MULTIPLIERS = {
+    "simple": 0.6,
+    "moderate": 1.0,
+    "complex": 1.5
+}
+
+# Prescreen results are reused for identical queries within this window
+_PRESCREEN_CACHE_TTL = 60.0
+_PRESCREEN_CACHE_SIZE = 256
+
 @dataclass
 class ToolMetadata:
     """Metadata for a single MCP tool"""
@@ -26,6 +137,11 @@ class ToolMetadata:
     parameters: List[str]
     use_cases: List[str]
     priority: int  # 1-5, 5 = highest priority
+    keyword_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Precomputed once for the per-query scoring loop
+        self.keyword_set = frozenset(self.keywords)
 
 @dataclass
 class QueryAnalysis:
@@ -44,6 +160,8 @@ class ToolPreScreener:
     def __init__(self, max_tools: int = 100):
         self.max_tools = max_tools
         self.tool_registry: Dict[str, ToolMetadata] = {}
+        self.core_tools: List[str] = []
+        self._prescreen_cache: Dict[tuple, tuple] = {}
         self.category_weights = {
             "core": 5,
             "analysis": 4, 
@@ -67,65 +185,21 @@ class ToolPreScreener:
         """Initialize the tool registry from MCP server configurations"""
         await self._scan_caelum_tools()
         await self._load_external_tools()
+        self.core_tools = [k for k, v in self.tool_registry.items() if v.category == "core"]
+        self._prescreen_cache.clear()
         logger.info(f"Initialized tool registry with {len(self.tool_registry)} tools")
         
     async def _scan_caelum_tools(self):
         """Scan Caelum MCP servers for available tools"""
         caelum_path = Path("/mnt/d/swdatasci/caelum")
         
-        # Define tool metadata for key Caelum servers
-        caelum_tools = {
-            "caelum-code-analysis": {
-                "category": "analysis",
-                "keywords": ["code", "security", "quality", "performance", "analyze", "review"],
-                "tools": ["analyze_code", "get_code_statistics", "search_similar_code"],
-                "priority": 5
-            },
-            "caelum-business-intelligence": {
-                "category": "business", 
-                "keywords": ["market", "research", "business", "intelligence", "competitor", "analysis"],
-                "tools": ["research_market"],
-                "priority": 4
-            },
-            "caelum-ollama-pool": {
-                "category": "core",
-                "keywords": ["llm", "route", "optimization", "cost", "local", "processing"],
-                "tools": ["route_llm_request", "get_pool_health_status", "optimize_model_distribution"],
-                "priority": 5
-            },
-            "caelum-project-intelligence": {
-                "category": "development",
-                "keywords": ["project", "analyze", "dependencies", "intelligence"],
-                "tools": ["analyze_project", "list_projects", "get_project_details"],
-                "priority": 4
-            },
-            "caelum-device-orchestration": {
-                "category": "infrastructure",
-                "keywords": ["device", "orchestration", "deployment", "infrastructure"],
-                "tools": ["list_devices", "register_device", "execute_command", "deploy_mcp_server"],
-                "priority": 3
-            },
-            "caelum-notifications": {
-                "category": "communication",
-                "keywords": ["notification", "alert", "message", "communication"],
-                "tools": ["send_notification", "list_notifications", "get_notification_status"],
-                "priority": 3
-            },
-            "filesystem": {
-                "category": "core",
-                "keywords": ["file", "directory", "read", "write", "filesystem"],
-                "tools": ["read_text_file", "write_file", "list_directory", "search_files"],
-                "priority": 5
-            }
-        }
-        
-        for server_name, metadata in caelum_tools.items():
+        for server_name, metadata in _CAELUM_TOOL_CATALOG.items():
             for tool_name in metadata["tools"]:
                 self.tool_registry[f"{server_name}::{tool_name}"] = ToolMetadata(
                     name=tool_name,
                     server=server_name,
                     category=metadata["category"],
-                    keywords=metadata["keywords"],
+                    keywords=list(metadata["keywords"]),
                     description=f"{tool_name} from {server_name}",
                     parameters=[],
                     use_cases=[],
@@ -134,22 +208,12 @@ class ToolPreScreener:
                 
     async def _load_external_tools(self):
         """Load external tools (Claude Code built-ins, etc.)"""
-        external_tools = {
-            "Read": {"category": "core", "keywords": ["read", "file", "content"], "priority": 5},
-            "Write": {"category": "core", "keywords": ["write", "file", "create"], "priority": 5},
-            "Edit": {"category": "core", "keywords": ["edit", "modify", "change"], "priority": 5},
-            "Bash": {"category": "core", "keywords": ["command", "execute", "shell"], "priority": 5},
-            "Grep": {"category": "analysis", "keywords": ["search", "find", "pattern"], "priority": 4},
-            "Glob": {"category": "analysis", "keywords": ["file", "pattern", "match"], "priority": 4},
-            "TodoWrite": {"category": "development", "keywords": ["todo", "task", "track"], "priority": 3}
-        }
-        
-        for tool_name, metadata in external_tools.items():
+        for tool_name, metadata in _EXTERNAL_TOOL_CATALOG.items():
             self.tool_registry[f"claude-code::{tool_name}"] = ToolMetadata(
                 name=tool_name,
                 server="claude-code",
                 category=metadata["category"],
-                keywords=metadata["keywords"],
+                keywords=list(metadata["keywords"]),
                 description=f"Claude Code built-in: {tool_name}",
                 parameters=[],
                 use_cases=[],
@@ -158,17 +222,22 @@ class ToolPreScreener:
     
     async def analyze_query(self, query: str, context: Dict[str, Any] = None) -> QueryAnalysis:
         """Analyze user query to understand intent and requirements"""
+        return self._analyze(query, context)
+
+    def _analyze(self, query: str, context: Dict[str, Any] = None) -> QueryAnalysis:
+        """Synchronous core of analyze_query - pure CPU work, no awaits needed"""
         query_lower = query.lower()
         
-        # Intent classification
-        intent = self._classify_intent(query_lower)
+        # Tokenize once; intent, entities and complexity all work from the words
+        words = _WORD_PATTERN.findall(query_lower)
+        keywords = set(words)
+        intent = self._classify_intent(keywords)
         
-        # Extract entities and keywords
-        entities = self._extract_entities(query)
-        keywords = set(re.findall(r'\b\w+\b', query_lower))
+        # Extract entities
+        entities = self._extract_entities(query, words)
         
         # Assess complexity
-        complexity = self._assess_complexity(query, context or {})
+        complexity = self._assess_complexity(query, keywords, context or {})
         
         # Estimate tools needed
         estimated_tools = self._estimate_tools_needed(intent, complexity)
@@ -181,40 +250,29 @@ class ToolPreScreener:
             estimated_tools_needed=estimated_tools
         )
     
-    def _classify_intent(self, query: str) -> str:
-        """Classify the primary intent of the query"""
-        intent_patterns = {
-            "code_analysis": r"\b(analyze|review|code|quality|security|performance|bug|error)\b",
-            "business_research": r"\b(market|business|research|competitor|intelligence|opportunity)\b",
-            "development": r"\b(develop|create|build|implement|session|time|track)\b",
-            "deployment": r"\b(deploy|infrastructure|server|orchestration|device)\b", 
-            "security": r"\b(security|compliance|audit|encrypt|vulnerability)\b",
-            "communication": r"\b(notify|alert|message|communication|send)\b",
-            "optimization": r"\b(optimize|performance|cost|efficiency|local)\b"
-        }
-        
-        for intent, pattern in intent_patterns.items():
-            if re.search(pattern, query):
+    def _classify_intent(self, keywords: Set[str]) -> str:
+        """Classify the primary intent from the query's (lowercased) words"""
+        for intent, intent_keywords in _INTENT_KEYWORDS.items():
+            if not intent_keywords.isdisjoint(keywords):
                 return intent
                 
         return "general"
     
-    def _extract_entities(self, query: str) -> List[str]:
+    def _extract_entities(self, query: str, words: List[str]) -> List[str]:
         """Extract relevant entities from the query"""
         # Simple entity extraction - can be enhanced with NLP
         entities = []
         
         # File extensions
-        file_patterns = re.findall(r'\.\w+\b', query)
+        file_patterns = _FILE_EXTENSION_PATTERN.findall(query)
         entities.extend(file_patterns)
         
         # Technology mentions
-        tech_patterns = re.findall(r'\b(python|javascript|typescript|node|react|api|database)\b', query.lower())
-        entities.extend(tech_patterns)
+        entities.extend(word for word in words if word in _TECH_WORDS)
         
         return entities
     
-    def _assess_complexity(self, query: str, context: Dict[str, Any]) -> str:
+    def _assess_complexity(self, query: str, keywords: Set[str], context: Dict[str, Any]) -> str:
         """Assess the complexity of the query"""
         factors = 0
         
@@ -223,14 +281,11 @@ class ToolPreScreener:
             factors += 1
             
         # Multiple intents
-        intents_found = sum(1 for pattern in [
-            r"\b(and|also|additionally|furthermore)\b",
-            r"\b(then|after|next|subsequently)\b"
-        ] if re.search(pattern, query.lower()))
+        intents_found = sum(1 for group in _MULTI_INTENT_WORDS if not group.isdisjoint(keywords))
         factors += intents_found
         
         # Technical complexity
-        if re.search(r"\b(integrate|implement|architecture|system|complex)\b", query.lower()):
+        if not _TECHNICAL_WORDS.isdisjoint(keywords):
             factors += 1
             
         # Context factors
@@ -246,25 +301,8 @@ class ToolPreScreener:
     
     def _estimate_tools_needed(self, intent: str, complexity: str) -> int:
         """Estimate number of tools needed based on intent and complexity"""
-        base_estimates = {
-            "code_analysis": 15,
-            "business_research": 10,
-            "development": 20,
-            "deployment": 12,
-            "security": 8,
-            "communication": 6,
-            "optimization": 10,
-            "general": 25
-        }
-        
-        complexity_multipliers = {
-            "simple": 0.6,
-            "moderate": 1.0,
-            "complex": 1.5
-        }
-        
-        base = base_estimates.get(intent, 25)
-        multiplier = complexity_multipliers.get(complexity, 1.0)
+        base = _BASE_TOOL_ESTIMATES.get(intent, 25)
+        multiplier = _COMPLEXITY_MULTIPLIERS.get(complexity, 1.0)
         
         return min(int(base * multiplier), self.max_tools)
     
@@ -273,8 +311,22 @@ class ToolPreScreener:
         Pre-screen tools based on query analysis
         Returns list of relevant tool names within limit
         """
-        analysis = await self.analyze_query(query, context)
-        
+        # Context only affects the analysis through the multi_step flag
+        key = (query, bool((context or {}).get("multi_step", False)), self.max_tools)
+        now = time.monotonic()
+        cached = self._prescreen_cache.get(key)
+        if cached is not None and now - cached[0] < _PRESCREEN_CACHE_TTL:
+            return list(cached[1])
+            
+        selected = self._select_tools(self._analyze(query, context))
+        if len(self._prescreen_cache) >= _PRESCREEN_CACHE_SIZE:
+            self._prescreen_cache.pop(next(iter(self._prescreen_cache)))
+        self._prescreen_cache.pop(key, None)
+        self._prescreen_cache[key] = (now, selected)
+        return list(selected)
+
+    def _select_tools(self, analysis: QueryAnalysis) -> List[str]:
+        """Select tool keys for an already-analyzed query"""
         # Get relevant servers for this intent
         relevant_servers = self.intent_tool_mapping.get(analysis.intent, [])
         
@@ -285,18 +337,21 @@ class ToolPreScreener:
             if score > 0:
                 tool_scores[tool_key] = score
         
-        # Sort by score and take top tools
-        sorted_tools = sorted(tool_scores.items(), key=lambda x: x[1], reverse=True)
-        selected_tools = [tool_key for tool_key, _ in sorted_tools[:analysis.estimated_tools_needed]]
+        # Take the top tools by score (ties keep registry order)
+        top_tools = heapq.nlargest(analysis.estimated_tools_needed, tool_scores.items(), key=lambda x: x[1])
+        selected_tools = [tool_key for tool_key, _ in top_tools]
         
         # Always include core tools
-        core_tools = [k for k, v in self.tool_registry.items() if v.category == "core"]
-        selected_tools.extend([t for t in core_tools if t not in selected_tools])
+        already_selected = set(selected_tools)
+        selected_tools.extend([t for t in self.core_tools if t not in already_selected])
         
         # Trim to max_tools limit
         final_tools = selected_tools[:self.max_tools]
         
-        logger.info(f"Pre-screened {len(self.tool_registry)} tools down to {len(final_tools)} for query intent: {analysis.intent}")
+        logger.debug(
+            "Pre-screened %d tools down to %d for query intent: %s",
+            len(self.tool_registry), len(final_tools), analysis.intent
+        )
         
         return final_tools
     
@@ -312,26 +367,23 @@ class ToolPreScreener:
             score += 10
             
         # Keyword matching
-        keyword_matches = len(set(tool.keywords) & analysis.keywords)
+        keyword_matches = len(tool.keyword_set & analysis.keywords)
         score += keyword_matches * 3
         
         # Category weight
         score += self.category_weights.get(tool.category, 1)
         
         # Intent-specific boosts
-        if analysis.intent == "code_analysis" and "code" in tool.keywords:
-            score += 5
-        elif analysis.intent == "business_research" and "business" in tool.keywords:
-            score += 5
-        elif analysis.intent == "security" and "security" in tool.keywords:
+        if _INTENT_BOOST_KEYWORDS.get(analysis.intent) in tool.keyword_set:
             score += 5
             
         return score
     
     async def get_prescreening_report(self, query: str) -> Dict[str, Any]:
         """Generate a detailed pre-screening report"""
-        analysis = await self.analyze_query(query)
-        selected_tools = await self.prescreen_tools(query)
+        # Analyze once and reuse it for selection instead of re-analyzing
+        analysis = self._analyze(query)
+        selected_tools = self._select_tools(analysis)
         
         return {
             "query_analysis": {
@@ -210,7 +210,7 @@ class UDPBeaconDiscovery:
                     self.cluster_listen_socket = None
                     return
                 else:
-                    logger.debug(f"Port {port} busy, trying next port")
+                    logger.debug("Port %s busy, trying next port", port)
                     continue
     
     def _beacon_loop(self):
@@ -270,7 +270,7 @@ class UDPBeaconDiscovery:
                             if cluster_beacon.get('type') in ['beacon', 'discovery'] and 'clusterId' in cluster_beacon:
                                 self._handle_cluster_beacon(cluster_beacon, addr[0])
                         except Exception as e:
-                            logger.debug(f"Invalid cluster beacon from {addr[0]}: {e}")
+                            logger.debug("Invalid cluster beacon from %s: %s", addr[0], e)
                             
                     except socket.timeout:
                         # Normal timeout, continue
@@ -368,9 +368,18 @@ class UDPBeaconDiscovery:
     def _handle_beacon_message(self, data: bytes, sender_ip: str):
         """Handle received beacon message."""
         try:
+            # Decode once; both beacon formats are tried against the same payload
+            try:
+                payload = json.loads(data.decode('utf-8'))
+            except ValueError:  # Covers both UnicodeDecodeError and JSONDecodeError
+                payload = None
+            if not isinstance(payload, dict):
+                logger.debug("Unknown beacon format from %s", sender_ip)
+                return
+                
             # Try to parse as Caelum Analytics beacon first
             try:
-                beacon = BeaconMessage.from_json(data)
+                beacon = BeaconMessage(**payload)
                 
                 # Ignore our own beacons
                 if beacon.machine_id == machine_registry.local_machine_id:
@@ -385,14 +394,13 @@ class UDPBeaconDiscovery:
             
             # Try to parse as regular Caelum cluster beacon
             try:
-                cluster_beacon = json.loads(data.decode('utf-8'))
-                if cluster_beacon.get('type') in ['beacon', 'discovery'] and 'clusterId' in cluster_beacon:
-                    self._handle_cluster_beacon(cluster_beacon, sender_ip)
+                if payload.get('type') in ['beacon', 'discovery'] and 'clusterId' in payload:
+                    self._handle_cluster_beacon(payload, sender_ip)
                     return
             except:
                 pass
                 
-            logger.debug(f"Unknown beacon format from {sender_ip}")
+            logger.debug("Unknown beacon format from %s", sender_ip)
             
         except Exception as e:
             logger.warning(f"Invalid beacon message from {sender_ip}: {e}")
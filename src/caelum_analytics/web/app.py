@@ -61,9 +61,11 @@ class ConnectionManager:
         self.active_connections.remove(websocket)
 
     async def broadcast(self, message: dict):
-        for connection in self.active_connections:
+        # Serialize once and fan the same payload out to every client
+        payload = json.dumps(message)
+        for connection in list(self.active_connections):
             try:
-                await connection.send_text(json.dumps(message))
+                await connection.send_text(payload)
             except:
                 # Remove failed connections
                 self.active_connections.remove(connection)
@@ -71,6 +73,17 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+# Static WebSocket frames, serialized once at import
+WS_CONNECTED_MESSAGE = json.dumps(
+    {
+        "type": "connection",
+        "data": {"message": "Connected to Caelum Analytics"},
+    }
+)
+WS_HEARTBEAT_MESSAGE = json.dumps(
+    {"type": "heartbeat", "data": {"timestamp": "2025-08-13T21:30:00Z"}}
+)
+
 # Cluster communication server
 cluster_server = None
 
@@ -1073,6 +1086,9 @@ async def get_servers():
     
     # List of known Caelum servers from settings
     expected_caelum_servers = settings.get_mcp_servers_list()
+
+    # One timestamp per status sweep rather than one per server
+    checked_at = datetime.now(timezone.utc).isoformat()
     
     # Check status of expected Caelum servers
     for server_name in expected_caelum_servers:
@@ -1098,7 +1114,7 @@ async def get_servers():
             "status": status,
             "response_time": info,
             "port": "MCP",
-            "last_check": datetime.now(timezone.utc).isoformat(),
+            "last_check": checked_at,
         })
 
     # Add any additional Caelum servers found in config that we don't know about
@@ -1109,7 +1125,7 @@ async def get_servers():
                 "status": "available",
                 "response_time": "additional Caelum server",
                 "port": "MCP",
-                "last_check": datetime.now(timezone.utc).isoformat(),
+                "last_check": checked_at,
             })
 
     available_count = sum(1 for s in server_statuses if s["status"] == "available")
@@ -1802,24 +1818,13 @@ async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     try:
         # Send initial data
-        await websocket.send_text(
-            json.dumps(
-                {
-                    "type": "connection",
-                    "data": {"message": "Connected to Caelum Analytics"},
-                }
-            )
-        )
+        await websocket.send_text(WS_CONNECTED_MESSAGE)
 
         # Keep connection alive and send periodic updates
         while True:
             # This would be replaced with real data collection
             await asyncio.sleep(5)
-            await websocket.send_text(
-                json.dumps(
-                    {"type": "heartbeat", "data": {"timestamp": "2025-08-13T21:30:00Z"}}
-                )
-            )
+            await websocket.send_text(WS_HEARTBEAT_MESSAGE)
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
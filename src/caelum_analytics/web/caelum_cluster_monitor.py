@@ -14,19 +14,34 @@ from fastapi import APIRouter, HTTPException, Query
 from typing import Dict, Any, Optional, List
 import asyncio
 import aiohttp
+import functools
 import logging
+import time
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=1)
+def _iso_for(second: int) -> str:
+    return datetime.fromtimestamp(second).isoformat()
+
+def _now_iso() -> str:
+    """Current local time as ISO 8601 at one-second resolution, formatted once per second"""
+    return _iso_for(int(time.time()))
+
 router = APIRouter(prefix="/api/cluster-monitor", tags=["Caelum Cluster Monitor"])
 
+# Dashboards poll cluster status; reuse a sweep for this many seconds
+CLUSTER_STATUS_TTL = 5.0
+
 class CaelumClusterMonitor:
     """Monitor distributed Caelum MCP servers"""
     
     def __init__(self):
         self.known_servers: Dict[str, Dict[str, Any]] = {}
         self.last_discovery_time = None
+        self._status_cache: Optional[tuple] = None  # (monotonic time, status)
+        self._discovery_generation = 0  # Bumped by every discovery pass
         
     async def discover_caelum_servers(self) -> List[Dict[str, Any]]:
         """Discover active Caelum MCP servers on the LAN"""
@@ -79,21 +94,23 @@ class CaelumClusterMonitor:
                                     "host": host,
                                     "status": "active",
                                     "health_data": health_data,
-                                    "last_seen": datetime.now().isoformat(),
+                                    "last_seen": _now_iso(),
                                     "endpoint": f"http://{host}:{server_config['port']}"
                                 }
                                 
                                 discovered_servers.append(server_info)
-                                logger.debug(f"✅ Found {server_config['name']} at {host}:{server_config['port']}")
+                                logger.debug("✅ Found %s at %s:%s", server_config["name"], host, server_config["port"])
                                 
                     except (aiohttp.ClientError, asyncio.TimeoutError):
                         # Server not available at this host:port
                         continue
                     except Exception as e:
-                        logger.debug(f"Error checking {server_config['name']} at {host}:{server_config['port']}: {e}")
+                        logger.debug("Error checking %s at %s:%s: %s", server_config["name"], host, server_config["port"], e)
         
         self.known_servers = {server["name"]: server for server in discovered_servers}
         self.last_discovery_time = datetime.now()
+        self._discovery_generation += 1
+        self._status_cache = None
         
         logger.info(f"🔍 Discovered {len(discovered_servers)} active Caelum servers")
         return discovered_servers
@@ -125,7 +142,7 @@ class CaelumClusterMonitor:
                                 
                                 return {
                                     "server_name": server_name,
-                                    "timestamp": datetime.now().isoformat(),
+                                    "timestamp": _now_iso(),
                                     "metrics": metrics_data,
                                     "response_time": response.headers.get("X-Response-Time"),
                                     "endpoint_used": endpoint
@@ -141,8 +158,13 @@ class CaelumClusterMonitor:
     async def get_cluster_optimization_status(self) -> Dict[str, Any]:
         """Get optimization status from the distributed Caelum cluster"""
         
+        if self._status_cache is not None and time.monotonic() - self._status_cache[0] < CLUSTER_STATUS_TTL:
+            return self._status_cache[1]
+            
         if not self.known_servers:
             await self.discover_caelum_servers()
+        # A discovery finishing mid-sweep makes this result stale; see below
+        generation = self._discovery_generation
             
         optimization_status = {
             "cluster_overview": {
@@ -175,7 +197,7 @@ class CaelumClusterMonitor:
                                 optimization_status["server_status"][server_name] = {
                                     "status": "active",
                                     "optimization_data": server_opt_status,
-                                    "last_updated": datetime.now().isoformat()
+                                    "last_updated": _now_iso()
                                 }
                                 
                                 # Aggregate optimization insights
@@ -185,12 +207,12 @@ class CaelumClusterMonitor:
                             else:
                                 optimization_status["server_status"][server_name] = {
                                     "status": "no_optimization_api",
-                                    "last_updated": datetime.now().isoformat()
+                                    "last_updated": _now_iso()
                                 }
                     except (aiohttp.ClientError, asyncio.TimeoutError):
                         optimization_status["server_status"][server_name] = {
                             "status": "unreachable",
-                            "last_updated": datetime.now().isoformat()
+                            "last_updated": _now_iso()
                         }
                         
             except Exception as e:
@@ -198,9 +220,11 @@ class CaelumClusterMonitor:
                 optimization_status["server_status"][server_name] = {
                     "status": "error",
                     "error": str(e),
-                    "last_updated": datetime.now().isoformat()
+                    "last_updated": _now_iso()
                 }
         
+        if generation == self._discovery_generation:
+            self._status_cache = (time.monotonic(), optimization_status)
         return optimization_status
 
 # Global cluster monitor instance
@@ -215,7 +239,7 @@ async def discover_cluster() -> Dict[str, Any]:
             "status": "success",
             "servers_discovered": len(servers),
             "servers": servers,
-            "discovery_time": datetime.now().isoformat()
+            "discovery_time": _now_iso()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
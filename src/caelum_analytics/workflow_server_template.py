@@ -8,10 +8,25 @@ This template shows how to create a workflow server that:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+from collections import defaultdict
+from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 import asyncio
+import heapq
 import json
+import os
+import re
+import time
+
+# Underlying service names shared by tool registrations and service clients
+CODE_ANALYSIS_SERVICE = "caelum-code-analysis"
+PROJECT_INTELLIGENCE_SERVICE = "caelum-project-intelligence"
+DEVELOPMENT_SESSION_SERVICE = "caelum-development-session"
+BUSINESS_INTELLIGENCE_SERVICE = "caelum-business-intelligence"
+OPPORTUNITY_DISCOVERY_SERVICE = "caelum-opportunity-discovery"
+USER_PROFILE_SERVICE = "caelum-user-profile"
 
 class QueryIntent(Enum):
     """Common query intents across workflows"""
@@ -22,30 +37,137 @@ class QueryIntent(Enum):
     OPTIMIZE = "optimize"
     RESEARCH = "research"
 
+# Query word -> intent it signals. Queries are matched on whole words, so the
+# common inflections and derived nouns are listed alongside each base keyword
+QUERY_INTENT_KEYWORDS = {
+    **dict.fromkeys((
+        "analyze", "analyzes", "analyzed", "analyzing", "analyzer", "analyzers",
+        "review", "reviews", "reviewed", "reviewing", "reviewer", "reviewers",
+        "check", "checks", "checked", "checking", "checker", "checkers",
+        "examine", "examines", "examined", "examining", "examiner", "examiners",
+    ), QueryIntent.ANALYZE),
+    **dict.fromkeys((
+        "create", "creates", "created", "creating",
+        "build", "builds", "built", "building", "builder", "builders",
+        "generate", "generates", "generated", "generating",
+        "make", "makes", "made", "making", "maker", "makers",
+    ), QueryIntent.CREATE),
+    **dict.fromkeys((
+        "manage", "manages", "managed", "managing",
+        "management", "manager", "managers", "manageable",
+        "organize", "organizes", "organized", "organizing", "organizer", "organizers",
+        "handle", "handles", "handled", "handling", "handler", "handlers",
+    ), QueryIntent.MANAGE),
+    **dict.fromkeys((
+        "monitor", "monitors", "monitored", "monitoring",
+        "track", "tracks", "tracked", "tracking", "tracker", "trackers",
+        "watch", "watches", "watched", "watching", "watcher", "watchers",
+    ), QueryIntent.MONITOR),
+    **dict.fromkeys((
+        "optimize", "optimizes", "optimized", "optimizing", "optimizer", "optimizers",
+        "improve", "improves", "improved", "improving", "improvement", "improvements",
+        "enhance", "enhances", "enhanced", "enhancing", "enhancement", "enhancements",
+        "enhancer", "enhancers",
+    ), QueryIntent.OPTIMIZE),
+    **dict.fromkeys((
+        "research", "researches", "researched", "researching", "researcher", "researchers",
+        "find", "finds", "found", "finding", "findings", "finder", "finders",
+        "discover", "discovers", "discovered", "discovering",
+        "discovery", "discoveries", "discoverer", "discoverers",
+    ), QueryIntent.RESEARCH),
+}
+
+# Keywords in a tool's name/description that mark it as serving an intent
+INTENT_TOOL_KEYWORDS = {
+    QueryIntent.ANALYZE: ("analyze", "review", "check", "scan"),
+    QueryIntent.CREATE: ("create", "generate", "build", "make"),
+    QueryIntent.MANAGE: ("manage", "organize", "handle", "control"),
+    QueryIntent.MONITOR: ("monitor", "track", "watch", "observe"),
+    QueryIntent.OPTIMIZE: ("optimize", "improve", "enhance", "boost"),
+    QueryIntent.RESEARCH: ("research", "find", "discover", "search"),
+}
+
+# Upper bound on cached tool selections per server
+SELECTION_CACHE_SIZE = 256
+
+# Per-service circuit breaker: consecutive failures before opening, and how
+# long an open circuit rejects calls before a trial call is allowed
+BREAKER_FAILURE_THRESHOLD = 2
+BREAKER_OPEN_SECONDS = 30.0
+
+# Cap on concurrent calls into underlying services, per server; overridden by
+# CAELUM_WORKFLOW_MAX_INFLIGHT, read when a server is constructed
+DEFAULT_MAX_INFLIGHT_CALLS = 32
+
+def _max_inflight_calls() -> int:
+    """Per-server concurrent service call limit, from the environment or the default"""
+    value = os.getenv("CAELUM_WORKFLOW_MAX_INFLIGHT")
+    if value is None:
+        return DEFAULT_MAX_INFLIGHT_CALLS
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValueError(f"CAELUM_WORKFLOW_MAX_INFLIGHT must be an integer, got {value!r}") from None
+    if limit < 1:
+        raise ValueError(f"CAELUM_WORKFLOW_MAX_INFLIGHT must be at least 1, got {limit}")
+    return limit
+
 class WorkflowContext:
     """Context for workflow tool selection"""
+    __slots__ = ("intent", "complexity", "entities", "max_tools")
+    
     def __init__(self, intent: QueryIntent, complexity: str, entities: List[str]):
         self.intent = intent
         self.complexity = complexity  # simple, moderate, complex
         self.entities = entities
         self.max_tools = 20  # Default max tools to expose
 
+@dataclass(frozen=True, slots=True)
 class WorkflowTool:
-    """Represents a workflow tool with metadata"""
-    def __init__(self, name: str, description: str, category: str, priority: int, underlying_service: str):
-        self.name = name
-        self.description = description
-        self.category = category
-        self.priority = priority  # 1-5, 5 = highest
-        self.underlying_service = underlying_service
+    """Represents a workflow tool with metadata (immutable, shared across servers)"""
+    name: str
+    description: str
+    category: str
+    priority: int  # 1-5, 5 = highest
+    underlying_service: str
+    search_text: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Lowercased name + description, matched against intent keywords
+        object.__setattr__(self, "search_text", f"{self.name} {self.description}".lower())
 
 class BaseWorkflowServer(ABC):
     """Base class for all workflow servers"""
     
+    # Subclasses declare their own (empty unless they add attributes)
+    __slots__ = (
+        "name",
+        "_selection_cache",
+        "_all_tools",
+        "service_clients",
+        "_breakers",
+        "_call_semaphore",
+    )
+    
     def __init__(self, name: str):
         self.name = name
-        self.all_tools: Dict[str, WorkflowTool] = {}
+        self._selection_cache: Dict[tuple, List[WorkflowTool]] = {}
+        self.all_tools = {}
         self.service_clients: Dict[str, Any] = {}
+        self._breakers: Dict[str, Dict[str, Any]] = {}
+        self._call_semaphore = asyncio.Semaphore(_max_inflight_calls())
+        
+    @property
+    def all_tools(self) -> Mapping[str, WorkflowTool]:
+        """Registered tools by name (read-only view)"""
+        return self._all_tools
+    
+    @all_tools.setter
+    def all_tools(self, tools: Dict[str, WorkflowTool]):
+        # Re-registering tools invalidates any cached selections. The view is
+        # over a private copy, so the caller's dict cannot change it later
+        self._all_tools = MappingProxyType(dict(tools))
+        self._selection_cache.clear()
         
     @abstractmethod
     async def register_tools(self):
@@ -59,26 +181,18 @@ class BaseWorkflowServer(ABC):
     
     def analyze_query_context(self, query: str) -> WorkflowContext:
         """Analyze query to determine context and intent"""
-        query_lower = query.lower()
-        
-        # Simple intent detection
-        if any(word in query_lower for word in ["analyze", "review", "check", "examine"]):
-            intent = QueryIntent.ANALYZE
-        elif any(word in query_lower for word in ["create", "build", "generate", "make"]):
-            intent = QueryIntent.CREATE
-        elif any(word in query_lower for word in ["manage", "organize", "handle"]):
-            intent = QueryIntent.MANAGE
-        elif any(word in query_lower for word in ["monitor", "track", "watch"]):
-            intent = QueryIntent.MONITOR
-        elif any(word in query_lower for word in ["optimize", "improve", "enhance"]):
-            intent = QueryIntent.OPTIMIZE
-        elif any(word in query_lower for word in ["research", "find", "discover"]):
-            intent = QueryIntent.RESEARCH
-        else:
-            intent = QueryIntent.ANALYZE  # Default
+        # Simple intent detection: one pass over the query's words, then the
+        # first matched intent in QueryIntent order wins
+        matched = {
+            QUERY_INTENT_KEYWORDS[word]
+            for word in re.findall(r"\w+", query.lower())
+            if word in QUERY_INTENT_KEYWORDS
+        }
+        intent = next((i for i in QueryIntent if i in matched), QueryIntent.ANALYZE)  # Default
             
         # Assess complexity
-        complexity = "complex" if len(query.split()) > 20 else "moderate" if len(query.split()) > 10 else "simple"
+        word_count = len(query.split())
+        complexity = "complex" if word_count > 20 else "moderate" if word_count > 10 else "simple"
         
         # Extract entities (simplified)
         entities = []
@@ -86,51 +200,100 @@ class BaseWorkflowServer(ABC):
         return WorkflowContext(intent, complexity, entities)
     
     def select_relevant_tools(self, context: WorkflowContext) -> List[WorkflowTool]:
-        """Select relevant tools based on query context"""
-        scored_tools = []
+        """Select relevant tools based on query context
         
-        for tool in self.all_tools.values():
-            score = self._score_tool_relevance(tool, context)
-            if score > 0:
-                scored_tools.append((tool, score))
+        Rankings are cached per distinct context, so repeated queries with the
+        same intent skip re-scoring the whole catalog.
+        """
+        key = (context.intent, context.complexity, tuple(context.entities), context.max_tools)
+        selected = self._selection_cache.get(key)
+        if selected is None:
+            selected = self._rank_tools(context)
+            if len(self._selection_cache) >= SELECTION_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._selection_cache[next(iter(self._selection_cache))]
+            self._selection_cache[key] = selected
+            
+        return list(selected)
+    
+    def _rank_tools(self, context: WorkflowContext) -> List[WorkflowTool]:
+        """Score every registered tool and return the top matches"""
+        scored_tools = (
+            (tool, score)
+            for tool in self.all_tools.values()
+            if (score := self._score_tool_relevance(tool, context)) > 0
+        )
                 
-        # Sort by score and take top tools
-        scored_tools.sort(key=lambda x: x[1], reverse=True)
-        selected = [tool for tool, _ in scored_tools[:context.max_tools]]
-        
-        return selected
+        # Take the top tools by score (ties keep registration order)
+        top = heapq.nlargest(context.max_tools, scored_tools, key=lambda x: x[1])
+        return [tool for tool, _ in top]
     
     def _score_tool_relevance(self, tool: WorkflowTool, context: WorkflowContext) -> float:
         """Score tool relevance for the given context"""
         score = tool.priority * 2  # Base priority score
         
         # Intent-based scoring
-        intent_tool_mapping = {
-            QueryIntent.ANALYZE: ["analyze", "review", "check", "scan"],
-            QueryIntent.CREATE: ["create", "generate", "build", "make"],
-            QueryIntent.MANAGE: ["manage", "organize", "handle", "control"],
-            QueryIntent.MONITOR: ["monitor", "track", "watch", "observe"],
-            QueryIntent.OPTIMIZE: ["optimize", "improve", "enhance", "boost"],
-            QueryIntent.RESEARCH: ["research", "find", "discover", "search"]
-        }
-        
-        intent_keywords = intent_tool_mapping.get(context.intent, [])
-        if any(keyword in tool.name.lower() or keyword in tool.description.lower() for keyword in intent_keywords):
+        intent_keywords = INTENT_TOOL_KEYWORDS.get(context.intent, ())
+        if any(keyword in tool.search_text for keyword in intent_keywords):
             score += 5
             
         return score
     
     async def route_to_service(self, tool_name: str, args: Dict[str, Any]) -> Any:
         """Route tool call to appropriate underlying service"""
-        if tool_name not in self.all_tools:
+        tool = self.all_tools.get(tool_name)
+        if tool is None:
             raise ValueError(f"Unknown tool: {tool_name}")
             
-        tool = self.all_tools[tool_name]
         service = self.service_clients.get(tool.underlying_service)
         
         if not service:
             raise ValueError(f"Service not available: {tool.underlying_service}")
             
+        # Circuit breaker: fail fast while a service is known to be down. Once
+        # the open window has passed, a single trial call is let through
+        # (half-open); only its outcome closes or re-opens the circuit
+        breaker = self._breakers.setdefault(
+            tool.underlying_service,
+            {"state": "closed", "failures": 0, "opened_at": 0.0, "trial_in_flight": False}
+        )
+        if breaker["state"] == "open":
+            if time.monotonic() - breaker["opened_at"] < BREAKER_OPEN_SECONDS:
+                raise ValueError(f"Service circuit open: {tool.underlying_service}")
+            breaker["state"] = "half_open"
+        is_trial = breaker["state"] == "half_open"
+        if is_trial:
+            if breaker["trial_in_flight"]:
+                raise ValueError(f"Service circuit open: {tool.underlying_service}")
+            breaker["trial_in_flight"] = True
+        started = time.monotonic()
+            
+        try:
+            async with self._call_semaphore:
+                result = await self._call_service(service, tool, args)
+        except Exception:
+            if is_trial:
+                breaker["state"] = "open"
+                breaker["opened_at"] = time.monotonic()
+            elif breaker["state"] == "closed" and started >= breaker["opened_at"]:
+                # Calls that started before the last open are stale and not counted
+                breaker["failures"] += 1
+                if breaker["failures"] >= BREAKER_FAILURE_THRESHOLD:
+                    breaker["state"] = "open"
+                    breaker["opened_at"] = time.monotonic()
+            raise
+        finally:
+            if is_trial:
+                breaker["trial_in_flight"] = False
+            
+        if is_trial or (breaker["state"] == "closed" and started >= breaker["opened_at"]):
+            breaker["state"] = "closed"
+            breaker["failures"] = 0
+        return result
+    
+    async def _call_service(self, service: Any, tool: WorkflowTool, args: Dict[str, Any]) -> Any:
+        """Invoke the underlying service for a tool call"""
+        tool_name = tool.name
         # This would call the actual underlying service
         # For now, return mock response
         return {
@@ -140,154 +303,193 @@ class BaseWorkflowServer(ABC):
             "args": args
         }
 
+    async def route_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """Route several tool calls at once, grouped by underlying service
+        
+        Each service's calls run concurrently, and results are returned in the
+        same order as ``calls``. Grouping keeps the door open for services that
+        can accept a whole batch in a single request.
+        
+        An unknown tool raises ValueError before any call is made. If a call
+        fails, its exception propagates and the results of the other calls in
+        the batch are discarded.
+        """
+        groups: Dict[str, List[Tuple[int, str, Dict[str, Any]]]] = defaultdict(list)
+        for index, (tool_name, args) in enumerate(calls):
+            tool = self.all_tools.get(tool_name)
+            if tool is None:
+                raise ValueError(f"Unknown tool: {tool_name}")
+            groups[tool.underlying_service].append((index, tool_name, args))
+            
+        results: List[Any] = [None] * len(calls)
+        
+        async def run_group(items: List[Tuple[int, str, Dict[str, Any]]]):
+            outputs = await asyncio.gather(
+                *(self.route_to_service(tool_name, args) for _, tool_name, args in items)
+            )
+            for (index, _, _), output in zip(items, outputs):
+                results[index] = output
+                
+        await asyncio.gather(*(run_group(items) for items in groups.values()))
+        return results
+
+# Tool catalogs are built once at import; servers take a shallow copy
+DEVELOPMENT_TOOLS = {
+    "analyze_code_quality": WorkflowTool(
+        "analyze_code_quality",
+        "Analyze code for quality, security, and performance issues",
+        "analysis",
+        5,
+        CODE_ANALYSIS_SERVICE
+    ),
+    "analyze_project_structure": WorkflowTool(
+        "analyze_project_structure", 
+        "Analyze project structure and dependencies",
+        "analysis",
+        4,
+        PROJECT_INTELLIGENCE_SERVICE
+    ),
+    "track_development_session": WorkflowTool(
+        "track_development_session",
+        "Track development time and productivity metrics", 
+        "management",
+        3,
+        DEVELOPMENT_SESSION_SERVICE
+    ),
+    "search_code_patterns": WorkflowTool(
+        "search_code_patterns",
+        "Find similar code patterns across projects",
+        "analysis", 
+        4,
+        CODE_ANALYSIS_SERVICE
+    ),
+    "get_development_metrics": WorkflowTool(
+        "get_development_metrics",
+        "Get development progress and productivity statistics",
+        "monitoring",
+        3,
+        DEVELOPMENT_SESSION_SERVICE
+    ),
+    "optimize_code_performance": WorkflowTool(
+        "optimize_code_performance",
+        "Get performance optimization suggestions",
+        "optimization",
+        4,
+        CODE_ANALYSIS_SERVICE
+    ),
+    "create_project_template": WorkflowTool(
+        "create_project_template",
+        "Create new project from template",
+        "creation",
+        3,
+        PROJECT_INTELLIGENCE_SERVICE
+    ),
+    "review_code_changes": WorkflowTool(
+        "review_code_changes", 
+        "Review code changes for quality and security",
+        "analysis",
+        5,
+        CODE_ANALYSIS_SERVICE
+    ),
+    "manage_project_dependencies": WorkflowTool(
+        "manage_project_dependencies",
+        "Manage and update project dependencies",
+        "management",
+        4,
+        PROJECT_INTELLIGENCE_SERVICE
+    ),
+    "generate_development_report": WorkflowTool(
+        "generate_development_report",
+        "Generate comprehensive development progress report",
+        "reporting", 
+        3,
+        DEVELOPMENT_SESSION_SERVICE
+    )
+}
+
 class DevelopmentWorkflowServer(BaseWorkflowServer):
     """Development workflow server implementation"""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__("caelum-development-workflow")
         
     async def register_tools(self):
         """Register development workflow tools"""
-        self.all_tools = {
-            "analyze_code_quality": WorkflowTool(
-                "analyze_code_quality",
-                "Analyze code for quality, security, and performance issues",
-                "analysis",
-                5,
-                "caelum-code-analysis"
-            ),
-            "analyze_project_structure": WorkflowTool(
-                "analyze_project_structure", 
-                "Analyze project structure and dependencies",
-                "analysis",
-                4,
-                "caelum-project-intelligence"
-            ),
-            "track_development_session": WorkflowTool(
-                "track_development_session",
-                "Track development time and productivity metrics", 
-                "management",
-                3,
-                "caelum-development-session"
-            ),
-            "search_code_patterns": WorkflowTool(
-                "search_code_patterns",
-                "Find similar code patterns across projects",
-                "analysis", 
-                4,
-                "caelum-code-analysis"
-            ),
-            "get_development_metrics": WorkflowTool(
-                "get_development_metrics",
-                "Get development progress and productivity statistics",
-                "monitoring",
-                3,
-                "caelum-development-session"
-            ),
-            "optimize_code_performance": WorkflowTool(
-                "optimize_code_performance",
-                "Get performance optimization suggestions",
-                "optimization",
-                4,
-                "caelum-code-analysis"
-            ),
-            "create_project_template": WorkflowTool(
-                "create_project_template",
-                "Create new project from template",
-                "creation",
-                3,
-                "caelum-project-intelligence"
-            ),
-            "review_code_changes": WorkflowTool(
-                "review_code_changes", 
-                "Review code changes for quality and security",
-                "analysis",
-                5,
-                "caelum-code-analysis"
-            ),
-            "manage_project_dependencies": WorkflowTool(
-                "manage_project_dependencies",
-                "Manage and update project dependencies",
-                "management",
-                4,
-                "caelum-project-intelligence"
-            ),
-            "generate_development_report": WorkflowTool(
-                "generate_development_report",
-                "Generate comprehensive development progress report",
-                "reporting", 
-                3,
-                "caelum-development-session"
-            )
-        }
+        self.all_tools = dict(DEVELOPMENT_TOOLS)
         
     async def initialize_services(self):
         """Initialize connections to underlying development services"""
         self.service_clients = {
-            "caelum-code-analysis": "MockCodeAnalysisClient()",
-            "caelum-project-intelligence": "MockProjectIntelligenceClient()",
-            "caelum-development-session": "MockDevelopmentSessionClient()"
+            CODE_ANALYSIS_SERVICE: "MockCodeAnalysisClient()",
+            PROJECT_INTELLIGENCE_SERVICE: "MockProjectIntelligenceClient()",
+            DEVELOPMENT_SESSION_SERVICE: "MockDevelopmentSessionClient()"
         }
 
+BUSINESS_TOOLS = {
+    "research_market_intelligence": WorkflowTool(
+        "research_market_intelligence",
+        "Conduct comprehensive market research and analysis",
+        "research",
+        5,
+        BUSINESS_INTELLIGENCE_SERVICE
+    ),
+    "discover_business_opportunities": WorkflowTool(
+        "discover_business_opportunities",
+        "Identify and analyze business opportunities",
+        "research",
+        5,
+        OPPORTUNITY_DISCOVERY_SERVICE
+    ),
+    "analyze_competitive_landscape": WorkflowTool(
+        "analyze_competitive_landscape",
+        "Analyze competitors and market positioning",
+        "analysis",
+        4,
+        BUSINESS_INTELLIGENCE_SERVICE
+    ),
+    "generate_business_insights": WorkflowTool(
+        "generate_business_insights",
+        "Generate actionable business intelligence reports",
+        "analysis",
+        4,
+        BUSINESS_INTELLIGENCE_SERVICE
+    ),
+    "track_user_preferences": WorkflowTool(
+        "track_user_preferences",
+        "Manage user profiles and preferences",
+        "management",
+        3,
+        USER_PROFILE_SERVICE
+    ),
+    "forecast_market_trends": WorkflowTool(
+        "forecast_market_trends",
+        "Forecast market trends and opportunities",
+        "analysis",
+        4,
+        BUSINESS_INTELLIGENCE_SERVICE
+    )
+}
+
 class BusinessWorkflowServer(BaseWorkflowServer):
     """Business intelligence workflow server implementation"""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__("caelum-business-workflow")
         
     async def register_tools(self):
         """Register business workflow tools"""
-        self.all_tools = {
-            "research_market_intelligence": WorkflowTool(
-                "research_market_intelligence",
-                "Conduct comprehensive market research and analysis",
-                "research",
-                5,
-                "caelum-business-intelligence"
-            ),
-            "discover_business_opportunities": WorkflowTool(
-                "discover_business_opportunities",
-                "Identify and analyze business opportunities",
-                "research",
-                5,
-                "caelum-opportunity-discovery"
-            ),
-            "analyze_competitive_landscape": WorkflowTool(
-                "analyze_competitive_landscape",
-                "Analyze competitors and market positioning",
-                "analysis",
-                4,
-                "caelum-business-intelligence"
-            ),
-            "generate_business_insights": WorkflowTool(
-                "generate_business_insights",
-                "Generate actionable business intelligence reports",
-                "analysis",
-                4,
-                "caelum-business-intelligence"
-            ),
-            "track_user_preferences": WorkflowTool(
-                "track_user_preferences",
-                "Manage user profiles and preferences",
-                "management",
-                3,
-                "caelum-user-profile"
-            ),
-            "forecast_market_trends": WorkflowTool(
-                "forecast_market_trends",
-                "Forecast market trends and opportunities",
-                "analysis",
-                4,
-                "caelum-business-intelligence"
-            )
-        }
+        self.all_tools = dict(BUSINESS_TOOLS)
         
     async def initialize_services(self):
         """Initialize connections to underlying business services"""
         self.service_clients = {
-            "caelum-business-intelligence": "MockBusinessIntelligenceClient()",
-            "caelum-opportunity-discovery": "MockOpportunityDiscoveryClient()",
-            "caelum-user-profile": "MockUserProfileClient()"
+            BUSINESS_INTELLIGENCE_SERVICE: "MockBusinessIntelligenceClient()",
+            OPPORTUNITY_DISCOVERY_SERVICE: "MockOpportunityDiscoveryClient()",
+            USER_PROFILE_SERVICE: "MockUserProfileClient()"
         }
 
 # Example usage
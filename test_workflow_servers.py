@@ -5,6 +5,7 @@ Comprehensive test suite for 5-workflow architecture MCP servers
 
 import sys
 import asyncio
+import functools
 import json
 from pathlib import Path
 import importlib.util
@@ -13,6 +14,20 @@ from typing import Dict, Any, List
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+# Imported once for the tests that exercise it; a failed import is re-raised by each of them
+try:
+    from caelum_analytics.workflow_servers.development.server import DevelopmentWorkflowServer
+    _DEVELOPMENT_IMPORT_ERROR = None
+except ImportError as e:
+    DevelopmentWorkflowServer = None
+    _DEVELOPMENT_IMPORT_ERROR = str(e)
+
+def _development_server():
+    """Instantiate the development workflow server imported at module load"""
+    if DevelopmentWorkflowServer is None:
+        raise ImportError(_DEVELOPMENT_IMPORT_ERROR)
+    return DevelopmentWorkflowServer()
+
 def test_import_all_servers():
     """Test that all workflow servers can be imported without errors"""
     print("🧪 Testing server imports...")
@@ -56,8 +71,9 @@ def test_server_initialization():
                 print(f"✅ {name} workflow server initialized")
                 
                 # Test that all_tools is populated
-                if hasattr(server, 'all_tools') and server.all_tools:
-                    print(f"   📊 {len(server.all_tools)} tools registered")
+                all_tools = getattr(server, 'all_tools', None)
+                if all_tools:
+                    print(f"   📊 {len(all_tools)} tools registered")
                 else:
                     print(f"   ⚠️  No tools found in {name} server")
                     
@@ -70,22 +86,20 @@ def test_server_initialization():
         print(f"❌ Server initialization error: {e}")
         return False
 
+REQUIRED_TOOL_FIELDS = frozenset({"name", "description", "priority", "category", "intents", "underlying_service", "schema"})
+
 def test_tool_definitions():
     """Test that tool definitions are properly structured"""
     print("\n🧪 Testing tool definitions...")
     
     try:
-        from caelum_analytics.workflow_servers.development.server import DevelopmentWorkflowServer
-        
-        server = DevelopmentWorkflowServer()
-        
-        required_fields = ["name", "description", "priority", "category", "intents", "underlying_service", "schema"]
+        server = _development_server()
         
         for tool_name, tool_def in server.all_tools.items():
-            for field in required_fields:
-                if field not in tool_def:
-                    print(f"❌ Tool {tool_name} missing field: {field}")
-                    return False
+            missing_fields = REQUIRED_TOOL_FIELDS - tool_def.keys()
+            if missing_fields:
+                print(f"❌ Tool {tool_name} missing fields: {', '.join(sorted(missing_fields))}")
+                return False
                     
             # Test schema structure
             schema = tool_def["schema"]
@@ -105,9 +119,7 @@ async def test_tool_execution():
     print("\n🧪 Testing tool execution...")
     
     try:
-        from caelum_analytics.workflow_servers.development.server import DevelopmentWorkflowServer
-        
-        server = DevelopmentWorkflowServer()
+        server = _development_server()
         
         # Test analyze_code_quality tool
         result = await server.execute_tool("analyze_code_quality", {
@@ -132,9 +144,7 @@ async def test_tool_selection():
     print("\n🧪 Testing intelligent tool selection...")
     
     try:
-        from caelum_analytics.workflow_servers.development.server import DevelopmentWorkflowServer
-        
-        server = DevelopmentWorkflowServer()
+        server = _development_server()
         
         # Test with security-focused query
         selected = await server.select_tools_for_context("analyze security vulnerabilities in my code", max_tools=5)
@@ -193,45 +203,177 @@ async def test_dynamic_explorer():
         print(f"❌ Dynamic explorer test error: {e}")
         return False
 
+async def test_circuit_breaker():
+    """Test the per-service circuit breaker in workflow tool routing"""
+    print("\n🧪 Testing service circuit breaker...")
+    
+    try:
+        from caelum_analytics import workflow_server_template as template
+        
+        class FlakyWorkflowServer(template.DevelopmentWorkflowServer):
+            """Development server whose underlying service can be made to fail"""
+            
+            def __init__(self):
+                super().__init__()
+                self.fail = True
+                self.gate = None  # When set, calls wait on it before completing
+                
+            async def _call_service(self, service, tool, args):
+                if self.gate is not None:
+                    await self.gate.wait()
+                if self.fail:
+                    raise ConnectionError(f"{tool.underlying_service} unreachable")
+                return await super()._call_service(service, tool, args)
+        
+        server = FlakyWorkflowServer()
+        await server.register_tools()
+        await server.initialize_services()
+        tool_name = "analyze_code_quality"
+        service_name = server.all_tools[tool_name].underlying_service
+        
+        # Consecutive failures up to the threshold open the circuit
+        for _ in range(template.BREAKER_FAILURE_THRESHOLD):
+            try:
+                await server.route_to_service(tool_name, {})
+                print("❌ Failing service call did not raise")
+                return False
+            except ConnectionError:
+                pass
+        breaker = server._breakers[service_name]
+        if breaker["state"] != "open":
+            print(f"❌ Circuit not opened after failures (state: {breaker['state']})")
+            return False
+            
+        # While open, calls fail fast without reaching the service
+        server.fail = False
+        try:
+            await server.route_to_service(tool_name, {})
+            print("❌ Open circuit let a call through")
+            return False
+        except ValueError:
+            pass
+        print("✅ Circuit opens after repeated failures and fails fast")
+        
+        # Past the open window a single trial call is let through; others
+        # arriving while it is in flight still fail fast
+        breaker["opened_at"] -= template.BREAKER_OPEN_SECONDS
+        server.gate = asyncio.Event()
+        trial = asyncio.create_task(server.route_to_service(tool_name, {}))
+        await asyncio.sleep(0)
+        try:
+            # A call that got through would block on the gate, hence the timeout
+            await asyncio.wait_for(server.route_to_service(tool_name, {}), timeout=1.0)
+            print("❌ Half-open circuit let a second call through")
+            return False
+        except ValueError:
+            pass
+        except asyncio.TimeoutError:
+            print("❌ Half-open circuit let a second call through")
+            trial.cancel()
+            return False
+        print("✅ Half-open circuit allows a single trial call")
+        
+        # The trial's success closes the circuit
+        server.gate.set()
+        result = await trial
+        if breaker["state"] != "closed" or breaker["failures"] or result.get("tool") != tool_name:
+            print(f"❌ Half-open success did not close the circuit (state: {breaker['state']})")
+            return False
+        print("✅ Half-open trial success closes the circuit")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Circuit breaker test error: {e}")
+        return False
+
+async def test_route_batch():
+    """Test batched tool routing across several underlying services"""
+    print("\n🧪 Testing batched tool routing...")
+    
+    try:
+        from caelum_analytics.workflow_server_template import DevelopmentWorkflowServer
+        
+        server = DevelopmentWorkflowServer()
+        await server.register_tools()
+        await server.initialize_services()
+        
+        # Interleave tools from different services; results must follow input order
+        calls = [
+            ("analyze_code_quality", {"call": 0}),
+            ("track_development_session", {"call": 1}),
+            ("create_project_template", {"call": 2}),
+            ("review_code_changes", {"call": 3}),
+            ("get_development_metrics", {"call": 4}),
+        ]
+        results = await server.route_batch(calls)
+        
+        services = {server.all_tools[tool_name].underlying_service for tool_name, _ in calls}
+        if [(result["tool"], result["args"]) for result in results] != calls:
+            print(f"❌ Batch results out of order: {[result['tool'] for result in results]}")
+            return False
+        print(f"✅ {len(calls)} calls across {len(services)} services returned in input order")
+        
+        # An unknown tool rejects the whole batch up front
+        try:
+            await server.route_batch([("analyze_code_quality", {}), ("no_such_tool", {})])
+            print("❌ Unknown tool in batch did not raise")
+            return False
+        except ValueError:
+            pass
+        print("✅ Unknown tool in batch raises ValueError")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Batch routing test error: {e}")
+        return False
+
+CLAUDE_CONFIG_PATH = Path("claude_config_5workflow_optimized.json")
+
+EXPECTED_WORKFLOW_SERVERS = frozenset({
+    "caelum-development-workflow",
+    "caelum-business-workflow",
+    "caelum-infrastructure-workflow",
+    "caelum-communication-workflow",
+    "caelum-security-workflow"
+})
+
+@functools.lru_cache(maxsize=1)
+def _load_claude_config(config_path: Path) -> Dict[str, Any]:
+    """Parse the optimized Claude config once per path"""
+    with open(config_path) as f:
+        return json.load(f)
+
 def test_claude_config():
     """Test Claude configuration file"""
     print("\n🧪 Testing Claude configuration...")
     
     try:
-        config_path = Path("claude_config_5workflow_optimized.json")
-        
-        if not config_path.exists():
+        if not CLAUDE_CONFIG_PATH.exists():
             print("❌ Optimized Claude config not found")
             return False
             
-        with open(config_path) as f:
-            config = json.load(f)
+        config = _load_claude_config(CLAUDE_CONFIG_PATH)
             
         if "mcpServers" not in config:
             print("❌ Invalid Claude config structure")
             return False
             
-        workflow_servers = [
-            "caelum-development-workflow",
-            "caelum-business-workflow", 
-            "caelum-infrastructure-workflow",
-            "caelum-communication-workflow",
-            "caelum-security-workflow"
-        ]
+        missing_servers = EXPECTED_WORKFLOW_SERVERS - config["mcpServers"].keys()
+        found_servers = len(EXPECTED_WORKFLOW_SERVERS) - len(missing_servers)
         
-        found_servers = 0
-        for server in workflow_servers:
-            if server in config["mcpServers"]:
-                found_servers += 1
-                print(f"   ✅ {server} configured")
-            else:
+        for server in sorted(EXPECTED_WORKFLOW_SERVERS):
+            if server in missing_servers:
                 print(f"   ❌ {server} missing from config")
+            else:
+                print(f"   ✅ {server} configured")
                 
-        if found_servers == len(workflow_servers):
+        if not missing_servers:
             print(f"✅ All {found_servers} workflow servers in Claude config")
             return True
         else:
-            print(f"❌ Only {found_servers}/{len(workflow_servers)} workflow servers configured")
+            print(f"❌ Only {found_servers}/{len(EXPECTED_WORKFLOW_SERVERS)} workflow servers configured")
             return False
             
     except Exception as e:
@@ -289,6 +431,8 @@ async def run_all_tests():
         ("Tool Definition Tests", test_tool_definitions),
         ("Tool Execution Tests", test_tool_execution),
         ("Tool Selection Tests", test_tool_selection),
+        ("Circuit Breaker Tests", test_circuit_breaker),
+        ("Batch Routing Tests", test_route_batch),
         ("Dynamic Explorer Tests", test_dynamic_explorer),
         ("Claude Config Tests", test_claude_config),
         ("Pre-hook System Tests", test_pre_hook_system)
@@ -311,26 +455,25 @@ async def run_all_tests():
             print(f"❌ {test_name} failed with exception: {e}")
             results.append((test_name, False))
     
-    # Summary
-    print(f"\n{'='*60}")
-    print("🎯 TEST SUMMARY")
-    print('='*60)
-    
+    # Summary - built up and written in one go
     passed = sum(1 for _, result in results if result)
     total = len(results)
     
+    lines = [f"\n{'='*60}", "🎯 TEST SUMMARY", '='*60]
     for test_name, result in results:
         status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{status} {test_name}")
+        lines.append(f"{status} {test_name}")
     
-    print(f"\n📊 Results: {passed}/{total} tests passed ({passed/total*100:.1f}%)")
+    lines.append(f"\n📊 Results: {passed}/{total} tests passed ({passed/total*100:.1f}%)")
     
     if passed == total:
-        print("\n🎉 ALL TESTS PASSED - 5-workflow architecture ready for deployment!")
-        return True
+        lines.append("\n🎉 ALL TESTS PASSED - 5-workflow architecture ready for deployment!")
     else:
-        print(f"\n⚠️  {total - passed} tests failed - please address issues before deployment")
-        return False
+        lines.append(f"\n⚠️  {total - passed} tests failed - please address issues before deployment")
+        
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    return passed == total
 
 if __name__ == "__main__":
     success = asyncio.run(run_all_tests())